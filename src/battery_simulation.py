@@ -1,7 +1,13 @@
 import argparse
+import hashlib
+import json
+import logging
 import os
 import time
 import calendar
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+import numpy as np
 from pandas import read_csv, DataFrame
 from dataclasses import dataclass
 
@@ -9,10 +15,23 @@ from tabulate import tabulate
 
 from src.utils import is_valid_path
 
+logger = logging.getLogger(__name__)
+
+# Numba is the fast path but not required: without it the simulation kernel
+# runs as plain Python over NumPy arrays, just slower
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
 
 @dataclass
 class TimeOfUse:
-    days_of_week: set[int]
+    days_of_week: frozenset[int]
+    days_mask: int
     start_hour: int
     end_hour: int
 
@@ -27,7 +46,9 @@ class TimeOfUse:
                              "Hours must be between 0 and 24 and start_hour must be less than end_hour.")
         self.start_hour = start_hour
         self.end_hour = end_hour
-        self.days_of_week = days_of_week
+        self.days_of_week = frozenset(days_of_week)
+        # Packed 7-bit mask, bit 0 is Monday; cheap to hash and test
+        self.days_mask = sum(1 << (day - 1) for day in days_of_week)
 
 
 @dataclass
@@ -46,23 +67,202 @@ def validate_electricity_prices(electricity_prices):
 
     :param electricity_prices: List of ElectricityPrice objects
     """
-    for day in range(1, 8):
-        day_prices = [price for price in electricity_prices if day in price.time_of_use.days_of_week]
-        day_prices.sort(key=lambda x: x.time_of_use.start_hour)
-        if not day_prices:
-            raise ValueError(f"❌ Missing electricity prices for {calendar.day_name[day - 1]}.")
-        if day_prices[0].time_of_use.start_hour != 0 or day_prices[-1].time_of_use.end_hour != 24:
+    build_price_table(electricity_prices)
+
+@njit(cache=True, fastmath=True)
+def _simulate(
+        reversed_arr,
+        consumption_arr,
+        battery_soc,
+        efficiency_charge,
+        efficiency_discharge,
+        battery_max_charge,
+        battery_min_charge,
+        battery_loss_cycle,
+        battery_nominal_capacity,
+        dod_limit,
+):
+    """
+    Run the per-row battery state update over plain NumPy arrays.
+
+    :param reversed_arr: Energy returned to the grid per row in Wh
+    :param consumption_arr: Energy taken from the grid per row in Wh
+    :param battery_soc: Initial state of charge of the battery in Wh
+    :param efficiency_charge: Efficiency of charging the battery
+    :param efficiency_discharge: Efficiency of discharging the battery
+    :param battery_max_charge: Maximum charge of the battery in Wh
+    :param battery_min_charge: Minimum charge of the battery in Wh
+    :param battery_loss_cycle: Capacity lost per full cycle in Wh
+    :param battery_nominal_capacity: Nominal capacity of the battery in Wh
+    :param dod_limit: Depth of discharge limit
+    :return: Tuple of output arrays and the number of rows simulated
+    """
+    n = reversed_arr.shape[0]
+    previous_soc_arr = np.zeros(n)
+    battery_soc_arr = np.zeros(n)
+    charge_arr = np.zeros(n)
+    discharge_arr = np.zeros(n)
+    bought_arr = np.zeros(n)
+    sold_arr = np.zeros(n)
+    cycles_arr = np.zeros(n)
+    max_charge_arr = np.zeros(n)
+    min_charge_arr = np.zeros(n)
+    capacity_arr = np.zeros(n)
+
+    # Loop-invariant factors: degradation constants and reciprocal efficiencies,
+    # so the hot loop only multiplies
+    k_deg = battery_loss_cycle / battery_nominal_capacity
+    inv_nominal = 1.0 / battery_nominal_capacity
+    one_minus_dod = 1.0 - dod_limit
+    inv_efficiency_charge = 1.0 / efficiency_charge
+    inv_efficiency_discharge = 1.0 / efficiency_discharge
+
+    previous_soc = battery_soc
+    discharge_total = 0.0
+    n_done = n
+    for i in range(n):
+        previous_soc_arr[i] = previous_soc
+        previous_soc = battery_soc
+
+        # Charge phase: clamp to the maximum charge, sell what could not be stored
+        soc_after_charge = min(previous_soc + reversed_arr[i] * efficiency_charge, battery_max_charge)
+        charge = max(0.0, soc_after_charge - previous_soc)
+        sold = max(0.0, reversed_arr[i] - charge * inv_efficiency_charge)
+
+        # Discharge phase: clamp to the minimum charge, buy what the battery could not cover
+        previous_soc = soc_after_charge
+        battery_soc = min(max(soc_after_charge - consumption_arr[i] * inv_efficiency_discharge,
+                              battery_min_charge), soc_after_charge)
+        discharge = soc_after_charge - battery_soc
+        bought = max(0.0, consumption_arr[i] - discharge * efficiency_discharge)
+
+        battery_soc_arr[i] = battery_soc
+        charge_arr[i] = charge
+        discharge_arr[i] = discharge
+        bought_arr[i] = bought
+        sold_arr[i] = sold
+
+        # Update battery capacity and cycles
+        discharge_total += discharge
+        battery_cycles = discharge_total * inv_nominal
+        battery_capacity = battery_nominal_capacity - discharge_total * k_deg
+        if battery_capacity <= 0:
+            n_done = i + 1
+            break
+        battery_max_charge = battery_capacity * one_minus_dod
+        battery_min_charge = battery_capacity * dod_limit
+
+        cycles_arr[i] = battery_cycles
+        max_charge_arr[i] = battery_max_charge
+        min_charge_arr[i] = battery_min_charge
+        capacity_arr[i] = battery_capacity
+    return (previous_soc_arr, battery_soc_arr, charge_arr, discharge_arr, bought_arr, sold_arr,
+            cycles_arr, max_charge_arr, min_charge_arr, capacity_arr, n_done)
+
+
+def build_price_table(electricity_prices):
+    """
+    Build a (7, 24) weekday-by-hour lookup table of electricity prices.
+
+    Filling the table also validates the time of use: a slot set twice
+    means overlapping prices, an unset slot means an uncovered hour.
+    Tables are cached on the price list contents, so validating in main
+    and simulating afterwards builds the table only once.
+
+    :param electricity_prices: List of ElectricityPrice objects
+    :return: NumPy array of shape (7, 24) indexed by [weekday, hour]
+    """
+    return _build_price_table_cached(tuple(
+        (p.time_of_use.days_mask, p.time_of_use.start_hour, p.time_of_use.end_hour, p.price)
+        for p in electricity_prices))
+
+
+@lru_cache(maxsize=8)
+def _build_price_table_cached(price_key):
+    price_table = np.full((7, 24), np.nan)
+    for days_mask, start_hour, end_hour, price in price_key:
+        for day in range(7):
+            if not (days_mask >> day) & 1:
+                continue
+            slots = price_table[day, start_hour:end_hour]
+            if not np.isnan(slots).all():
+                raise ValueError(f"❌ Electricity prices overlap for {calendar.day_name[day]}. "
+                                 f"Please check the time of use for each price.")
+            price_table[day, start_hour:end_hour] = price
+    for day in range(7):
+        if np.isnan(price_table[day]).all():
+            raise ValueError(f"❌ Missing electricity prices for {calendar.day_name[day]}.")
+        if np.isnan(price_table[day]).any():
             raise ValueError(f"❌ The time of use must start at 0 and end at 24 to cover the entire day "
-                             f"for {calendar.day_name[day - 1]}.")
-        for i, price in enumerate(day_prices):
-            for j, other_price in enumerate(day_prices):
-                if (
-                        i != j and
-                        price.time_of_use.start_hour < other_price.time_of_use.end_hour and
-                        price.time_of_use.end_hour > other_price.time_of_use.start_hour
-                ):
-                    raise ValueError(f"❌ Electricity prices overlap for {calendar.day_name[day - 1]}. "
-                                     f"Please check the time of use for each price.")
+                             f"for {calendar.day_name[day]}.")
+    return price_table
+
+
+@dataclass
+class SimParams:
+    """Scalar parameters of the battery simulation."""
+    battery_nominal_capacity: float = 10000
+    initial_charge: float = 0.20
+    efficiency_charge: float = 0.95
+    efficiency_discharge: float = 0.95
+    electricity_sell_price: float = 0.10
+    battery_cycles: int = 5000
+    battery_capacity_after_cycles: float = 0.80
+    dod_limit: float = 0.30
+
+
+def _run_simulation_core(reversed_arr, consumption_arr, hour_arr, weekday_arr, price_table, params):
+    """
+    Run the simulation on plain arrays and return the output columns.
+
+    :param reversed_arr: Energy returned to the grid per row in Wh
+    :param consumption_arr: Energy taken from the grid per row in Wh
+    :param hour_arr: Hour of day per row
+    :param weekday_arr: Weekday per row, 0 for Monday
+    :param price_table: (7, 24) price lookup table from build_price_table
+    :param params: SimParams with the scalar simulation parameters
+    :return: Tuple of a column name to array dict and the number of rows simulated
+    """
+    battery_loss_cycle = (params.battery_capacity_after_cycles / params.battery_cycles) \
+        * params.battery_nominal_capacity
+    (previous_soc_arr, battery_soc_arr, charge_arr, discharge_arr, bought_arr, sold_arr,
+     cycles_arr, max_charge_arr, min_charge_arr, capacity_arr, n_done) = _simulate(
+        reversed_arr,
+        consumption_arr,
+        params.battery_nominal_capacity * params.initial_charge,
+        params.efficiency_charge,
+        params.efficiency_discharge,
+        params.battery_nominal_capacity * (1 - params.dod_limit),
+        params.battery_nominal_capacity * params.dod_limit,
+        battery_loss_cycle,
+        params.battery_nominal_capacity,
+        params.dod_limit,
+    )
+
+    # Calculate costs and revenues; rows past a dead battery stay zero,
+    # matching the simulation outputs
+    electricity_buy_price_arr = price_table[weekday_arr, hour_arr]
+    electricity_buy_price_arr[n_done:] = 0.0
+    revenue_without_battery_arr = (reversed_arr / 1000) * params.electricity_sell_price
+    revenue_without_battery_arr[n_done:] = 0.0
+    columns = {
+        "previous_soc": previous_soc_arr,
+        "battery_soc": battery_soc_arr,
+        "charge": charge_arr,
+        "discharge": discharge_arr,
+        "bought": bought_arr,
+        "sold": sold_arr,
+        "cycles": cycles_arr,
+        "max_charge": max_charge_arr,
+        "min_charge": min_charge_arr,
+        "capacity": capacity_arr,
+        "cost_without_battery": (consumption_arr / 1000) * electricity_buy_price_arr,
+        "revenue_without_battery": revenue_without_battery_arr,
+        "cost_with_battery": (bought_arr / 1000) * electricity_buy_price_arr,
+        "revenue_with_battery": (sold_arr / 1000) * params.electricity_sell_price,
+    }
+    return columns, n_done
+
 
 def run_simulation(
         df: DataFrame,
@@ -89,101 +289,128 @@ def run_simulation(
     :param battery_cycles: Number of battery cycles before capacity degradation
     :param battery_capacity_after_cycles: Battery capacity after the specified number of cycles
     :param dod_limit: Depth of discharge limit
-    :return: DataFrame with simulation results
+    :return: DataFrame with simulation results; if the battery dies before
+        the end of the data, all rows after the death row hold zeros
     """
     if not electricity_buy_prices:
         electricity_buy_prices = [ElectricityPrice(TimeOfUse(0, 24), 0.30)]
-    validate_electricity_prices(electricity_buy_prices)
-    battery_loss_cycle = (battery_capacity_after_cycles / battery_cycles) * battery_nominal_capacity
-    battery_max_charge = battery_nominal_capacity * (1 - dod_limit)
-    battery_min_charge = battery_nominal_capacity * dod_limit
-
-    # Sort the DataFrame by datetime and remove duplicates
-    df = df.sort_values(by="datetime")
-    df = df.drop_duplicates(subset=["datetime"])
+    price_table = build_price_table(electricity_buy_prices)
+    params = SimParams(
+        battery_nominal_capacity=battery_nominal_capacity,
+        initial_charge=initial_charge,
+        efficiency_charge=efficiency_charge,
+        efficiency_discharge=efficiency_discharge,
+        electricity_sell_price=electricity_sell_price,
+        battery_cycles=battery_cycles,
+        battery_capacity_after_cycles=battery_capacity_after_cycles,
+        dod_limit=dod_limit,
+    )
+
+    # Index on datetime, then remove duplicates and sort only when needed;
+    # data from get_data/generate_data is already clean, so the common
+    # path avoids the copies entirely
     df = df.set_index("datetime")
+    if df.index.has_duplicates:
+        df = df[~df.index.duplicated(keep="first")]
+    if not df.index.is_monotonic_increasing:
+        df = df.sort_index()
+
+    # Run the simulation on plain arrays; pandas stays at the edges
+    columns, n_done = _run_simulation_core(
+        df["reversed"].to_numpy(dtype=np.float64),
+        df["consumption"].to_numpy(dtype=np.float64),
+        df.index.hour.to_numpy(),
+        df.index.weekday.to_numpy(),
+        price_table,
+        params,
+    )
+    if n_done < len(df):
+        print(f"🪫 Battery is dead. Stopping simulation.")
+
+    # Per-row diagnostics are debug-only; the guard skips the loop entirely and
+    # the %-style arguments are only formatted when a handler wants the record
+    if logger.isEnabledFor(logging.DEBUG):
+        for i in range(n_done):
+            logger.debug("📅 %s - SOC: %.2f Wh - Capacity: %.2f Wh - Cycles: %.2f - "
+                         "Max Charge: %.2f Wh - Min Charge: %.2f Wh",
+                         df.index[i], columns["battery_soc"][i], columns["capacity"][i],
+                         columns["cycles"][i], columns["max_charge"][i], columns["min_charge"][i])
+
+    # Update the DataFrame values; float32 is plenty for Wh-scale values
+    # and halves the memory traffic of the serialization step
+    for name, arr in columns.items():
+        df[name] = arr.astype(np.float32, copy=False)
+    return df
 
-    # Start the simulation
-    battery_soc =  battery_nominal_capacity * initial_charge
-    previous_soc = battery_soc
-    discharge_total = 0
-    for index, row in df.iterrows():
-        charge, discharge, bought, sold = 0, 0, 0, 0
-        df.at[index, "previous_soc"] = previous_soc
-        previous_soc = battery_soc
-        # Check if there is energy coming in
-        if row["reversed"] > 0:
-            battery_soc += round(row["reversed"] * efficiency_charge, 10)
-            # Check if the battery SOC is above the maximum charge
-            if battery_soc > battery_max_charge:
-                battery_soc = battery_max_charge
-                charge = battery_soc - previous_soc
-                sold = round(row["reversed"] - (charge * efficiency_charge))
-            else:
-                charge = round(row["reversed"] * efficiency_charge)
-
-        # Check if there is energy going out
-        previous_soc = battery_soc
-        if row["consumption"] > 0:
-            battery_soc -= round(row["consumption"] / efficiency_discharge, 10)
-            # Check if the battery SOC is below the minimum charge
-            if previous_soc <= battery_min_charge:
-                battery_soc = previous_soc
-                bought = row["consumption"]
-            elif battery_soc <= battery_min_charge:
-                battery_soc = battery_min_charge
-                discharge = previous_soc - battery_min_charge
-                bought = round(row["consumption"] - (discharge * efficiency_discharge), 10)
-            else:
-                discharge = round(row["consumption"] * efficiency_discharge)
-
-        # Print actions performed in sequence
-        if charge > 0:
-            print(f"➕ Charging {charge:.2f} Wh")
-        if sold > 0:
-            print(f"💵 Selling {sold:.2f} Wh")
-        if discharge > 0:
-            print(f"➖ Discharging {discharge:.2f} Wh")
-        if bought > 0:
-            print(f"💸 Buying {bought:.2f} Wh")
-
-        # Update the DataFrame values
-        df.at[index, "battery_soc"] = battery_soc
-        df.at[index, "charge"] = charge
-        df.at[index, "discharge"] = discharge
-        df.at[index, "bought"] = bought
-        df.at[index, "sold"] = sold
-
-        # Calculate costs and revenues
-        electricity_buy_price = next(p.price for p in electricity_buy_prices if
-                                     p.time_of_use.start_hour <= index.hour < p.time_of_use.end_hour and
-                                     index.weekday() + 1 in p.time_of_use.days_of_week)
-        df.at[index, "cost_without_battery"] = (df.at[index, "consumption"] / 1000) * electricity_buy_price
-        df.at[index, "revenue_without_battery"] = (df.at[index, "reversed"] / 1000) * electricity_sell_price
-        df.at[index, "cost_with_battery"] = (df.at[index, "bought"] / 1000) * electricity_buy_price
-        df.at[index, "revenue_with_battery"] = (df.at[index, "sold"] / 1000) * electricity_sell_price
+def parse_electricity_prices(price_specs):
+    """
+    Parse electricity price specs in the 'days_of_week-start_hour-end_hour-price' format.
 
-        # Update battery capacity and cycles
-        discharge_total += discharge
-        battery_cycles = discharge_total / battery_nominal_capacity
-        battery_capacity = battery_nominal_capacity - (battery_cycles * battery_loss_cycle)
-        if battery_capacity <= 0:
-            print(f"🪫 Battery is dead. Stopping simulation.")
-            break
-        battery_max_charge = battery_capacity * (1 - dod_limit)
-        battery_min_charge = battery_capacity * dod_limit
+    :param price_specs: List of price spec strings, for example '1234567-0-24-0.30'
+    :return: List of ElectricityPrice objects
+    """
+    electricity_prices = []
+    for spec in price_specs:
+        days_of_week, start_hour, end_hour, price = spec.split("-")
+        electricity_prices.append(ElectricityPrice(
+            TimeOfUse(
+                int(start_hour),
+                int(end_hour),
+                set(map(int, days_of_week))),
+            float(price)))
+    return electricity_prices
+
+
+def _sweep_worker(df, kwargs, out_path, out_format):
+    """
+    Run a single sweep scenario and save its results.
+
+    :param df: Input DataFrame
+    :param kwargs: Keyword arguments for run_simulation
+    :param out_path: Path of the result file
+    :param out_format: Output file format, 'csv' or 'parquet'
+    """
+    results = run_simulation(df, **kwargs)
+    if out_format == "parquet":
+        results.to_parquet(out_path, engine="pyarrow", compression="zstd")
+    else:
+        results.to_csv(out_path, index=True)
+
+
+def run_sweep(df, base_kwargs, scenarios, csv_out, out_format):
+    """
+    Run one simulation per scenario in parallel across processes.
+
+    Each scenario is a dict of run_simulation parameter overrides; an
+    'energy_bought_price' entry holds price specs in the CLI format.
+    Results are saved next to csv_out with a scenario hash in the name.
+
+    :param df: Input DataFrame
+    :param base_kwargs: Baseline keyword arguments for run_simulation
+    :param scenarios: List of parameter override dicts
+    :param csv_out: Path of the base result file
+    :param out_format: Output file format, 'csv' or 'parquet'
+    """
+    print(f"🔁 Running {len(scenarios)} scenarios on {os.cpu_count()} workers...")
+    start_time = time.time()
+    root, ext = os.path.splitext(csv_out)
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = {}
+        for scenario in scenarios:
+            kwargs = dict(base_kwargs)
+            overrides = dict(scenario)
+            if "energy_bought_price" in overrides:
+                kwargs["electricity_buy_prices"] = parse_electricity_prices(overrides.pop("energy_bought_price"))
+            kwargs.update(overrides)
+            tag = hashlib.md5(json.dumps(scenario, sort_keys=True).encode()).hexdigest()[:8]
+            out_path = f"{root}_{tag}{ext}"
+            futures[executor.submit(_sweep_worker, df, kwargs, out_path, out_format)] = (scenario, out_path)
+        for future in as_completed(futures):
+            scenario, out_path = futures[future]
+            future.result()
+            print(f"✅ Scenario {scenario} saved to {out_path}")
+    print(f"⏱️ Sweep completed in {time.time() - start_time:.2f} seconds")
 
-        df.at[index, "cycles"] = battery_cycles
-        df.at[index, "max_charge"] = battery_max_charge
-        df.at[index, "min_charge"] = battery_min_charge
-        df.at[index, "capacity"] = battery_nominal_capacity - (battery_cycles * battery_loss_cycle)
-        print(f"📅 {index} - "
-              f"SOC: {battery_soc:.2f} Wh - "
-              f"Capacity: {battery_capacity:.2f} Wh - "
-              f"Cycles: {battery_cycles:.2f} - "
-              f"Max Charge: {battery_max_charge:.2f} Wh - "
-              f"Min Charge: {battery_min_charge:.2f} Wh")
-    return df
 
 def read_data(csv_file):
     """
@@ -193,7 +420,8 @@ def read_data(csv_file):
     :return: DataFrame containing the data from the CSV file
     """
     try:
-        df = read_csv(csv_file, parse_dates=["datetime"])
+        df = read_csv(csv_file, engine="pyarrow", parse_dates=["datetime"],
+                      dtype={"consumption": np.float32, "reversed": np.float32})
         return df
     except Exception as e:
         print(f"❌ Error reading CSV file: {e}")
@@ -207,7 +435,9 @@ def main():
     parser.add_argument("--csv_data", default="./data/shelly_data.csv",
                         help="Path to the data CSV file (default: ./data/shelly_data.csv)")
     parser.add_argument("--csv_out", default="./output/simulation_results.csv",
-                        help="Path to the result CSV file (default: ./output/simulation_results.csv)")
+                        help="Path to the result file (default: ./output/simulation_results.csv)")
+    parser.add_argument("--format", choices=["csv", "parquet"], default="csv",
+                        help="Output file format (default: csv)")
     parser.add_argument("--battery_nominal_capacity", type=float, default=10000,
                         help="Nominal capacity of the battery in Wh (default: 10000)")
     parser.add_argument("--initial_charge", type=float, default=0.20,
@@ -228,22 +458,23 @@ def main():
                         help="Battery capacity after the specified number of cycles in percentage (default: 0.80)")
     parser.add_argument("--dod_limit", type=float, default=0.30,
                         help="Depth of discharge limit in percentage (default: 0.30)")
+    parser.add_argument("--sweep",
+                        help="Path to a JSON file with a list of run_simulation parameter overrides; "
+                             "runs one simulation per entry in parallel and saves one result file each")
+    parser.add_argument("--verbose", action="store_true",
+                        help="Log the per-row simulation state (default: off)")
 
     args = parser.parse_args()
 
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO,
+                        format="%(message)s")
+
     if not is_valid_path(args.csv_out):
         return
 
-    electricity_prices = []
     if args.energy_bought_price:
-        for price in [price for prices in args.energy_bought_price for price in prices]:
-            days_of_week, start_hour, end_hour, price = price.split("-")
-            electricity_prices.append(ElectricityPrice(
-                TimeOfUse(
-                    int(start_hour),
-                    int(end_hour),
-                    set(map(int, days_of_week))),
-                float(price)))
+        electricity_prices = parse_electricity_prices(
+            [price for prices in args.energy_bought_price for price in prices])
     else:
         electricity_prices = [ElectricityPrice(TimeOfUse(0, 24), 0.30)]
 
@@ -259,6 +490,23 @@ def main():
         return
     print(f"✅ Data loaded successfully with {df.shape[0]} rows and {df.shape[1]} columns.")
 
+    if args.sweep:
+        with open(args.sweep) as f:
+            scenarios = json.load(f)
+        base_kwargs = {
+            "battery_nominal_capacity": args.battery_nominal_capacity,
+            "initial_charge": args.initial_charge,
+            "efficiency_charge": args.efficiency_charge,
+            "efficiency_discharge": args.efficiency_discharge,
+            "electricity_buy_prices": electricity_prices,
+            "electricity_sell_price": args.energy_sell_price,
+            "battery_cycles": args.battery_cycles,
+            "battery_capacity_after_cycles": args.battery_capacity_after_cycles,
+            "dod_limit": args.dod_limit,
+        }
+        run_sweep(df, base_kwargs, scenarios, args.csv_out, args.format)
+        return
+
     start_time = time.time()
     results = run_simulation(
         df,
@@ -274,7 +522,10 @@ def main():
     )
     print(f"⏱️ Simulation completed in {time.time() - start_time:.2f} seconds")
 
-    results.to_csv(args.csv_out, index=True)
+    if args.format == "parquet":
+        results.to_parquet(args.csv_out, engine="pyarrow", compression="zstd")
+    else:
+        results.to_csv(args.csv_out, index=True)
     print(f"✅ Simulation results saved to {args.csv_out}")
 
     args_file = os.path.join(os.path.dirname(args.csv_out), "simulation_args.txt")
@@ -1,5 +1,4 @@
 import argparse
-import asyncio
 import os
 import time
 
@@ -7,75 +6,60 @@ import numpy as np
 import pandas as pd
 from src.utils import is_valid_path
 
-# Seasonal adjustment function
+# Seasonal adjustment factor per month (vectorized over month arrays)
 def seasonal_adjustment(month, cold_months, hot_months, cold_factor, hot_factor):
-    if month in cold_months:
-        return cold_factor
-    elif month in hot_months:
-        return hot_factor
-    else:
-        return 1.0
-
-# Determine daylight hours based on the month
+    return np.where(np.isin(month, cold_months), cold_factor,
+                    np.where(np.isin(month, hot_months), hot_factor, 1.0))
+
+# Determine daylight hours based on the month (vectorized over month arrays)
 def get_daylight_hours(month, cold_months, hot_months, cold_range, hot_range):
-    if month in cold_months:
-        return cold_range
-    elif month in hot_months:
-        return hot_range
-    else:
-        return round((cold_range[0] + hot_range[0]) / 2), round((cold_range[1] + hot_range[1]) / 2)
-
-# Determine solar production range based on the month
+    mild_range = round((cold_range[0] + hot_range[0]) / 2), round((cold_range[1] + hot_range[1]) / 2)
+    is_cold = np.isin(month, cold_months)
+    is_hot = np.isin(month, hot_months)
+    start = np.where(is_cold, cold_range[0], np.where(is_hot, hot_range[0], mild_range[0]))
+    end = np.where(is_cold, cold_range[1], np.where(is_hot, hot_range[1], mild_range[1]))
+    return start, end
+
+# Determine solar production range based on the month (vectorized over month arrays)
 def get_production_range(month, cold_months, hot_months, cold_range, hot_range):
-    if month in cold_months:
-        return cold_range
-    elif month in hot_months:
-        return hot_range
-    else:
-        return round((cold_range[0] + hot_range[0]) / 2), round((cold_range[1] + hot_range[1]) / 2)
-
-# Energy consumption model
-async def generate_consumption(hour, month, base_range, peak_range, cold_months, hot_months, cold_factor, hot_factor):
-    if 6 <= hour < 9 or 17 <= hour < 22:  # Peak hours
-        peak = np.random.uniform(*peak_range)
-    else:
-        peak = np.random.uniform(*base_range)
-    return round(peak * seasonal_adjustment(month, cold_months, hot_months, cold_factor, hot_factor))
+    return get_daylight_hours(month, cold_months, hot_months, cold_range, hot_range)
+
+# Energy consumption model over whole hour/month arrays
+def generate_consumption(rng, hour, month, base_range, peak_range, cold_months, hot_months, cold_factor, hot_factor):
+    is_peak = ((hour >= 6) & (hour < 9)) | ((hour >= 17) & (hour < 22))  # Peak hours
+    peak = rng.uniform(np.where(is_peak, peak_range[0], base_range[0]),
+                       np.where(is_peak, peak_range[1], base_range[1]))
+    return np.round(peak * seasonal_adjustment(month, cold_months, hot_months, cold_factor, hot_factor)).astype(np.int64)
 
 # Solar energy production model with variable daylight hours and seasonal ranges
-async def generate_production(hour, month, cold_months, hot_months, cold_daylight_range, hot_daylight_range, cold_production_range, hot_production_range):
+def generate_production(rng, hour, month, cold_months, hot_months, cold_daylight_range, hot_daylight_range, cold_production_range, hot_production_range):
     daylight_start, daylight_end = get_daylight_hours(month, cold_months, hot_months, cold_daylight_range, hot_daylight_range)
     production_min, production_max = get_production_range(month, cold_months, hot_months, cold_production_range, hot_production_range)
 
-    if daylight_start <= hour < daylight_end:
-        peak = np.sin((hour - daylight_start) / (daylight_end - daylight_start) * np.pi) * np.random.uniform(production_min, production_max)
-        return round(peak)
-    return 0
+    peak = np.sin((hour - daylight_start) / (daylight_end - daylight_start) * np.pi) * rng.uniform(production_min, production_max)
+    return np.where((hour >= daylight_start) & (hour < daylight_end), np.round(peak), 0).astype(np.int64)
 
-# Function to calculate energy taken from and returned to the grid
+# Calculate energy taken from and returned to the grid (vectorized over whole arrays)
 def calculate_grid_usage(consumed, produced, self_consumption_ratio):
-    used_from_production = min(consumed, produced * self_consumption_ratio)
+    used_from_production = np.minimum(consumed, produced * self_consumption_ratio)
     net_consumed = consumed - used_from_production
     net_produced = produced - used_from_production
 
-    taken_from_grid = max(0, net_consumed)
-    returned_to_grid = max(0, net_produced)
+    taken_from_grid = np.maximum(0, net_consumed)
+    returned_to_grid = np.maximum(0, net_produced)
 
     return taken_from_grid, returned_to_grid
 
-# Async function to generate data for a single year
-async def generate_yearly_data(year, base_range, peak_range, cold_months, hot_months, cold_factor, hot_factor, self_consumption_ratio, cold_daylight_range, hot_daylight_range, cold_production_range, hot_production_range):
+# Generate data for a single year
+def generate_yearly_data(rng, year, base_range, peak_range, cold_months, hot_months, cold_factor, hot_factor, self_consumption_ratio, cold_daylight_range, hot_daylight_range, cold_production_range, hot_production_range):
     hours = pd.date_range(start=f"{year}-01-01", end=f"{year}-12-31 23:00", freq='h')
+    hour = hours.hour.to_numpy()
+    month = hours.month.to_numpy()
 
-    generate_consumption_tasks = [generate_consumption(h.hour, h.month, base_range, peak_range, cold_months, hot_months, cold_factor, hot_factor) for h in hours]
-    generate_production_tasks = [generate_production(h.hour, h.month, cold_months, hot_months, cold_daylight_range, hot_daylight_range, cold_production_range, hot_production_range) for h in hours]
-    consumed, produced = await asyncio.gather(
-        asyncio.gather(*generate_consumption_tasks),
-        asyncio.gather(*generate_production_tasks)
-    )
+    consumed = generate_consumption(rng, hour, month, base_range, peak_range, cold_months, hot_months, cold_factor, hot_factor)
+    produced = generate_production(rng, hour, month, cold_months, hot_months, cold_daylight_range, hot_daylight_range, cold_production_range, hot_production_range)
 
-    grid_usage = [calculate_grid_usage(c, p, self_consumption_ratio) for c, p in zip(consumed, produced)]
-    taken_from_grid, returned_to_grid = zip(*grid_usage)
+    taken_from_grid, returned_to_grid = calculate_grid_usage(consumed, produced, self_consumption_ratio)
 
     df = pd.DataFrame({
         "datetime": hours,
@@ -89,15 +73,16 @@ async def generate_yearly_data(year, base_range, peak_range, cold_months, hot_mo
     return df
 
 # Generate energy dataset
-async def generate_energy_data(start_year, years, base_range, peak_range, cold_months, hot_months, cold_factor, hot_factor, self_consumption_ratio, cold_daylight_range, hot_daylight_range, cold_production_range, hot_production_range):
-    tasks = [
-        generate_yearly_data(year, base_range, peak_range, cold_months, hot_months, cold_factor, hot_factor, self_consumption_ratio, cold_daylight_range, hot_daylight_range, cold_production_range, hot_production_range)
+def generate_energy_data(start_year, years, base_range, peak_range, cold_months, hot_months, cold_factor, hot_factor, self_consumption_ratio, cold_daylight_range, hot_daylight_range, cold_production_range, hot_production_range, seed=None):
+    rng = np.random.default_rng(seed)
+    yearly_data = [
+        generate_yearly_data(rng, year, base_range, peak_range, cold_months, hot_months, cold_factor, hot_factor, self_consumption_ratio, cold_daylight_range, hot_daylight_range, cold_production_range, hot_production_range)
         for year in range(start_year, start_year + years)
     ]
-    return pd.concat(await asyncio.gather(*tasks), ignore_index=True)
+    return pd.concat(yearly_data, ignore_index=True)
 
 # Main function with argparse
-async def main():
+def main():
     parser = argparse.ArgumentParser(description="Generate energy dataset with seasonal solar production and self-consumption.")
 
     parser.add_argument("--out", type=str, default="./data/generated_data.csv", help="Path to the CSV file (default: ./data/generated_data.csv)")
@@ -118,6 +103,8 @@ async def main():
     parser.add_argument("--cold_production_range", type=int, nargs=2, default=(1000, 3000), help="Cold months production range (Wh).")
     parser.add_argument("--hot_production_range", type=int, nargs=2, default=(3000, 6000), help="Hot months production range (Wh).")
 
+    parser.add_argument("--seed", type=int, default=None, help="Random seed for reproducible datasets.")
+
     args = parser.parse_args()
 
     if not is_valid_path(args.out):
@@ -125,7 +112,7 @@ async def main():
 
     print("🔋 Generating energy data...")
     start_time = time.time()
-    df = await generate_energy_data(args.start_year, args.years, args.base_range, args.peak_range, args.cold_months, args.hot_months, args.cold_factor, args.hot_factor, args.self_consumption_ratio, args.cold_daylight_range, args.hot_daylight_range, args.cold_production_range, args.hot_production_range)
+    df = generate_energy_data(args.start_year, args.years, args.base_range, args.peak_range, args.cold_months, args.hot_months, args.cold_factor, args.hot_factor, args.self_consumption_ratio, args.cold_daylight_range, args.hot_daylight_range, args.cold_production_range, args.hot_production_range, args.seed)
     print(f"⏱️ Generation completed in {time.time() - start_time:.2f} seconds")
 
     df.to_csv(args.out, index=False)
@@ -140,4 +127,4 @@ async def main():
     print(f"✅ Generation parameters saved to {args_file}")
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    main()
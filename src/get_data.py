@@ -2,6 +2,10 @@ import csv
 import datetime
 import os
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import pyarrow as pa
+import pyarrow.csv as pacsv
 import requests
 from dotenv import load_dotenv
 
@@ -36,15 +40,42 @@ def get_data(start_date, end_date, csv_file):
         "Accept": "application/json"
     }
 
-    # Load existing datetime values from the CSV file to avoid duplicates
+    # Load existing datetime values from the CSV file to avoid duplicates;
+    # keep the column as strings so they compare against the API values as-is
     existing_dates = set()
-    if os.path.exists(csv_file):
-        with open(csv_file, mode="r", newline="") as file:
-            reader = csv.reader(file)
-            next(reader, None)  # Skip header row
-            for row in reader:
-                if row:  # Ensure row is not empty
-                    existing_dates.add(row[0])  # Assuming 'datetime' is in the first column
+    if os.path.exists(csv_file) and os.path.getsize(csv_file) > 0:
+        table = pacsv.read_csv(
+            csv_file,
+            convert_options=pacsv.ConvertOptions(column_types={"datetime": pa.string()}))
+        existing_dates = set(table.column("datetime").to_pylist())
+
+    # Collect the days that still need fetching
+    days_to_fetch = []
+    current_date = start_date
+    while current_date <= end_date:
+
+        # Format date in the required format
+        day = current_date.strftime("%Y-%m-%d")
+        first_hour = current_date.strftime("%Y-%m-%d 00:00:00")
+        last_hour = (current_date + datetime.timedelta(hours=23)).strftime("%Y-%m-%d 23:00:00")
+
+        # Move to the next day
+        current_date += datetime.timedelta(days=1)
+
+        # Skip request if the datetime already exists in the CSV file
+        if first_hour in existing_dates and last_hour in existing_dates:
+            print(f"➡️ Skipping {day}, already in CSV.")
+            continue
+
+        # Set query parameters
+        params = {
+            "date_from": first_hour,
+            "date_range": "day",
+            "channel": 0,
+            "id": shelly_id,
+            "auth_key": shelly_auth_key,
+        }
+        days_to_fetch.append((day, params))
 
     # Open CSV file in append mode
     with open(csv_file, mode="a", newline="") as file:
@@ -54,60 +85,43 @@ def get_data(start_date, end_date, csv_file):
         if os.path.getsize(csv_file) == 0:
             writer.writerow(["datetime", "consumption", "reversed"])
 
-        # Loop through each day in the range
-        current_date = start_date
-        while current_date <= end_date:
-
-            # Format date in the required format
-            day = current_date.strftime("%Y-%m-%d")
-            first_hour = current_date.strftime("%Y-%m-%d 00:00:00")
-            last_hour = (current_date + datetime.timedelta(hours=23)).strftime("%Y-%m-%d 23:00:00")
-
-            # Move to the next day
-            current_date += datetime.timedelta(days=1)
-
-            # Skip request if the datetime already exists in the CSV file
-            if first_hour in existing_dates and last_hour in existing_dates:
-                print(f"➡️ Skipping {day}, already in CSV.")
-                continue
-
-            # Set query parameters
-            params = {
-                "date_from": first_hour,
-                "date_range": "day",
-                "channel": 0,
-                "id": shelly_id,
-                "auth_key": shelly_auth_key,
+        # Fetch the days concurrently over a shared keep-alive session;
+        # responses are parsed and written from this thread only
+        session = requests.Session()
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = {
+                executor.submit(session.get, url, headers=headers, params=params, timeout=30): day
+                for day, params in days_to_fetch
             }
-
-            # Make the GET request
-            response = requests.get(url, headers=headers, params=params)
-
-            # Check if the request was successful
-            if response.status_code == 200:
-                body = response.json()
-                data = body["sum"]
-
-                # Ensure response contains the expected properties
-                if isinstance(data, list):  # Assuming the API returns a list of records
-                    for entry in data:
-                        datetime_value = entry.get("datetime", "N/A")
-                        if entry.get("missing"):
-                            print(f"➡️ Skipping {datetime_value}, missing data.")
-                            continue
-                        consumption_value = entry.get("consumption", "N/A")
-                        reversed_value = entry.get("reversed", "N/A")
-
-                        # Append to CSV
-                        if datetime_value not in existing_dates:
-                            writer.writerow([datetime_value, consumption_value, reversed_value])
-                            print(f"➕ Appended: {datetime_value}, {consumption_value}, {reversed_value}")
-                        else:
-                            print(f"➡️ Skipping {datetime_value}, already in CSV.")
+            for future in as_completed(futures):
+                day = futures[future]
+                response = future.result()
+
+                # Check if the request was successful
+                if response.status_code == 200:
+                    body = response.json()
+                    data = body["sum"]
+
+                    # Ensure response contains the expected properties
+                    if isinstance(data, list):  # Assuming the API returns a list of records
+                        for entry in data:
+                            datetime_value = entry.get("datetime", "N/A")
+                            if entry.get("missing"):
+                                print(f"➡️ Skipping {datetime_value}, missing data.")
+                                continue
+                            consumption_value = entry.get("consumption", "N/A")
+                            reversed_value = entry.get("reversed", "N/A")
+
+                            # Append to CSV
+                            if datetime_value not in existing_dates:
+                                writer.writerow([datetime_value, consumption_value, reversed_value])
+                                print(f"➕ Appended: {datetime_value}, {consumption_value}, {reversed_value}")
+                            else:
+                                print(f"➡️ Skipping {datetime_value}, already in CSV.")
+                    else:
+                        print(f"⚠️ Unexpected response format for {day}: {body}")
                 else:
-                    print(f"⚠️ Unexpected response format for {day}: {body}")
-            else:
-                print(f"⚠️ Error for {day}: {response.status_code}, {response.text}")
+                    print(f"⚠️ Error for {day}: {response.status_code}, {response.text}")
 
     print(f"\n✅ Data collection complete. Saved to {csv_file}")
 